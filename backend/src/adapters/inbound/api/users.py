@@ -1,11 +1,11 @@
 """User API endpoints for profile management."""
 
-from collections.abc import Generator
-from contextlib import contextmanager
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import Response
+from pydantic import BaseModel
 
 from ....application.dependencies import get_user_service
 from ....application.dtos import (
@@ -15,11 +15,7 @@ from ....application.dtos import (
     UserProfileResponse,
 )
 from ....domain.users.entities import User
-from ....domain.users.services import (
-    UserAlreadyExistsError,
-    UserNotFoundError,
-    UserService,
-)
+from ....domain.users.services import UserService
 
 router = APIRouter(prefix="/users", tags=["users"])
 
@@ -27,22 +23,9 @@ router = APIRouter(prefix="/users", tags=["users"])
 UserServiceDep = Annotated[UserService, Depends(get_user_service)]
 
 
-@contextmanager
-def handle_user_exceptions() -> Generator[None]:
-    """Map domain exceptions to appropriate HTTP responses."""
-    try:
-        yield
-    except UserNotFoundError as e:
-        raise HTTPException(status.HTTP_404_NOT_FOUND, str(e)) from e
-    except UserAlreadyExistsError as e:
-        raise HTTPException(status.HTTP_409_CONFLICT, str(e)) from e
-    except ValueError as e:
-        raise HTTPException(status.HTTP_400_BAD_REQUEST, str(e)) from e
-
-
 def _to_response(user: User) -> UserProfileResponse:
-    """Map domain entity to API response."""
-    return UserProfileResponse(
+    """Map domain entity to API response (entity is already validated, so skip re-validation)."""
+    return UserProfileResponse.model_construct(
         id=user.id,
         username=user.username,
         email=user.email,
@@ -54,78 +37,98 @@ def _to_response(user: User) -> UserProfileResponse:
     )
 
 
+def _json_response(body: BaseModel, status_code: int = status.HTTP_200_OK) -> Response:
+    """Serialize a response DTO straight to JSON bytes with its compiled pydantic-core serializer.
+
+    Endpoints return this instead of declaring ``response_model`` so FastAPI does not
+    validate and serialize the returned model a second time; the models stay in
+    ``responses=`` for the OpenAPI schema.
+    """
+    return Response(body.model_dump_json(), status_code=status_code, media_type="application/json")
+
+
 @router.post(
     "",
-    response_model=UserProfileResponse,
+    response_model=None,
     status_code=status.HTTP_201_CREATED,
+    responses={status.HTTP_201_CREATED: {"model": UserProfileResponse}},
     summary="Create a new user",
     description="Create a new user. Username and email must be unique.",
 )
-def create_user(request: CreateUserRequest, service: UserServiceDep) -> UserProfileResponse:
+async def create_user(request: CreateUserRequest, service: UserServiceDep) -> Response:
     """Create user with the provided profile data."""
-    with handle_user_exceptions():
-        user = service.create_user(
-            username=request.username,
-            email=request.email,
-            first_name=request.first_name,
-            last_name=request.last_name,
-            phone_number=request.phone_number,
-            profile_photo_url=request.profile_photo_url,
-        )
-        return _to_response(user)
+    user = await service.create_user(
+        username=request.username,
+        email=request.email,
+        first_name=request.first_name,
+        last_name=request.last_name,
+        phone_number=request.phone_number,
+        profile_photo_url=request.profile_photo_url,
+    )
+    return _json_response(_to_response(user), status.HTTP_201_CREATED)
 
 
 @router.get(
     "",
-    response_model=UserListResponse,
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": UserListResponse}},
     summary="List all users",
-    description="Paginated user list. Default limit: 20, max: 100.",
+    description=(
+        "Paginated user list ordered by username. Default limit: 20, clamped to 1-100; "
+        "offset: users to skip. Pass next_cursor back as `after` to fetch the next page without OFFSET."
+    ),
 )
-def list_users(
+async def list_users(
     service: UserServiceDep,
-    limit: int = Query(20, ge=1, le=100, description="Max users to return"),
-    offset: int = Query(0, ge=0, description="Users to skip"),
-) -> UserListResponse:
-    """Return paginated list of users."""
-    users = service.list_users(limit=limit, offset=offset)
-    return UserListResponse(
+    limit: int = 20,
+    offset: int = 0,
+    after: str | None = None,
+) -> Response:
+    """Return paginated list of users, serialized in one pass by pydantic-core."""
+    # Clamp instead of Query(ge=..., le=...) validators: out-of-range values are corrected, not rejected
+    limit = max(1, min(limit, 100))
+    offset = max(0, offset)
+    users, total = await service.list_users(limit=limit, offset=offset, after_username=after)
+    payload = UserListResponse.model_construct(
         users=[_to_response(u) for u in users],
-        total=service.get_total_user_count(),
+        total=total,
         limit=limit,
         offset=offset,
+        next_cursor=users[-1].username if len(users) == limit else None,
     )
+    return _json_response(payload)
 
 
 @router.get(
     "/{user_id}",
-    response_model=UserProfileResponse,
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": UserProfileResponse}},
     summary="Get user by ID",
     description="Retrieve profile for a specific user.",
 )
-def get_user(user_id: UUID, service: UserServiceDep) -> UserProfileResponse:
+async def get_user(user_id: UUID, service: UserServiceDep) -> Response:
     """Fetch user by ID or raise 404."""
-    with handle_user_exceptions():
-        return _to_response(service.get_user(user_id))
+    return _json_response(_to_response(await service.get_user(user_id)))
 
 
 @router.put(
     "/{user_id}",
-    response_model=UserProfileResponse,
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": UserProfileResponse}},
     summary="Update user profile",
     description="Partial update of user profile fields.",
 )
-def update_user_profile(
+async def update_user_profile(
     user_id: UUID,
     request: UpdateUserProfileRequest,
     service: UserServiceDep,
-) -> UserProfileResponse:
+) -> Response:
     """Update user profile with provided fields."""
-    with handle_user_exceptions():
-        user = service.update_user_profile(
-            user_id=user_id,
-            first_name=request.first_name,
-            last_name=request.last_name,
-            email=request.email,
-            phone_number=request.phone_number,
-        )
-        return _to_response(user)
+    user = await service.update_user_profile(
+        user_id=user_id,
+        first_name=request.first_name,
+        last_name=request.last_name,
+        email=request.email,
+        phone_number=request.phone_number,
+    )
+    return _json_response(_to_response(user))
@@ -1,41 +1,48 @@
 """Database configuration and session management.
 
-This module provides SQLAlchemy engine, session factory, and FastAPI dependency
-for database sessions following the dependency injection pattern.
+This module provides the async SQLAlchemy engine, session factory, and FastAPI
+dependency for database sessions following the dependency injection pattern.
 """
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator
 from typing import Annotated
 
 from fastapi import Depends
-from sqlalchemy import create_engine  # type: ignore
-from sqlalchemy.orm import Session, sessionmaker  # type: ignore
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from ....application.config import settings
+from ....application.config import get_settings
 from .models import Base
 
+settings = get_settings()
+
 # Database URL
 DATABASE_URL = settings.DATABASE_URL
 
-# Create SQLAlchemy engine
-engine = create_engine(
+# Create async SQLAlchemy engine
+engine = create_async_engine(
     DATABASE_URL,
-    echo=True,  # Set to False in production
+    echo=settings.SQL_ECHO,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,  # Recycle before server-side idle timeouts kick in
+    pool_pre_ping=True,  # Transparently replace stale connections
 )
 
 # Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
 
 
-def create_tables() -> None:
+async def create_tables() -> None:
     """Create all tables in the database.
 
     This should be called on application startup or use Alembic migrations.
     """
-    Base.metadata.create_all(bind=engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
 
 
-def get_db() -> Generator[Session]:
+async def get_db() -> AsyncGenerator[AsyncSession]:
     """FastAPI dependency for database sessions.
 
     Provides a database session that is automatically closed after the request.
@@ -43,16 +50,14 @@ def get_db() -> Generator[Session]:
     Yields:
         Database session
     """
-    db = SessionLocal()
-    try:
-        yield db
-        db.commit()  # Commit transaction on success
-    except Exception:
-        db.rollback()  # Rollback on error
-        raise
-    finally:
-        db.close()
+    async with SessionLocal() as db:
+        try:
+            yield db
+            await db.commit()  # Commit transaction on success
+        except Exception:
+            await db.rollback()  # Rollback on error
+            raise
 
 
 # Type alias for dependency injection
-DBSession = Annotated[Session, Depends(get_db)]
+DBSession = Annotated[AsyncSession, Depends(get_db)]
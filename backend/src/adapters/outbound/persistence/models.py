@@ -1,16 +1,24 @@
 """SQLAlchemy ORM models for database persistence."""
 
 import uuid
-from datetime import datetime
+from datetime import UTC, datetime
 
 from sqlalchemy import DateTime, String  # type: ignore
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column  # type: ignore
 
 
 class Base(DeclarativeBase):  # type: ignore[misc]
-    """Base class for all ORM models."""
-
-    pass
+    """Base class for all ORM models.
+
+    Relationship loading policy:
+    - to-many relationships declare ``lazy="selectin"`` (one batched ``IN (...)``
+      query instead of one query per parent row, and no row explosion on lists);
+    - ``lazy="joined"`` is reserved for to-one relationships on the FK side;
+    - read queries select plain columns (see ``_USER_COLUMNS`` in the user
+      repository) and build entities from the rows, so no ORM instance is loaded
+      and no lazy load can fire; a query that does load ORM instances names its
+      relationships with ``.options(selectinload(...))``.
+    """
 
 
 class UserORM(Base):
@@ -22,10 +30,11 @@ class UserORM(Base):
     __tablename__ = "users"
 
     id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    # Unique index also serves list_all's ORDER BY username (index scan, no sort)
     username: Mapped[str] = mapped_column(String(50), unique=True, index=True)
     email: Mapped[str] = mapped_column(String(100), unique=True, index=True)
     first_name: Mapped[str] = mapped_column(String(100))
     last_name: Mapped[str] = mapped_column(String(100))
     phone_number: Mapped[str | None] = mapped_column(String(20), nullable=True)
     profile_photo_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
-    registration_date: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
+    registration_date: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(UTC))
@@ -1,71 +1,139 @@
 """SQLAlchemy implementation of the User repository."""
 
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import func, select
-from sqlalchemy.orm import Session
+from sqlalchemy import Select, func, lambda_stmt, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm.attributes import InstrumentedAttribute
 
 from ....domain.users.entities import User
-from ....domain.users.repositories import IUserRepository
+from ....domain.users.services import UserNotFoundError
 from .models import UserORM
 
+# Columns read back into User.from_trusted, in its positional parameter order
+_USER_COLUMNS = (
+    UserORM.id,
+    UserORM.username,
+    UserORM.email,
+    UserORM.first_name,
+    UserORM.last_name,
+    UserORM.registration_date,
+    UserORM.phone_number,
+    UserORM.profile_photo_url,
+)
 
-class SQLAlchemyUserRepository(IUserRepository):
-    """SQLAlchemy adapter for user persistence."""
+# Statements built once at import; per-call variations (limit, offset, cursor) are bound
+# parameters, so they also hit the engine's compiled-statement cache.
+_COUNT_USERS = select(func.count()).select_from(UserORM)
+_LIST_USERS = select(*_USER_COLUMNS, _COUNT_USERS.scalar_subquery().label("total")).order_by(UserORM.username)
+_LIST_PAGE = select(*_USER_COLUMNS).order_by(UserORM.username)
 
-    def __init__(self, session: Session) -> None:
-        self._session = session
 
-    def get_by_id(self, user_id: UUID) -> User | None:
-        return self._get_one_by(UserORM.id, user_id)
+def _paginate[S: Select[Any]](stmt: S, limit: int, offset: int, after_username: str | None) -> S:
+    """Apply the page window and, for keyset pagination, the username cursor."""
+    stmt = stmt.limit(limit).offset(offset)
+    return stmt if after_username is None else stmt.where(UserORM.username > after_username)
 
-    def get_by_username(self, username: str) -> User | None:
-        return self._get_one_by(UserORM.username, username)
 
-    def get_by_email(self, email: str) -> User | None:
-        return self._get_one_by(UserORM.email, email)
+class SQLAlchemyUserRepository:
+    """SQLAlchemy adapter for user persistence (implements ``IUserRepository``).
 
-    def save(self, user: User) -> User:
-        orm = self._to_orm(user)
-        self._session.add(orm)
-        self._session.flush()
-        return self._to_entity(orm)
+    Reads and updates select plain columns and build entities straight from the
+    rows, so no ORM instances, identity-map entries or lazy relationships are
+    involved on those paths.
+    """
 
-    def update(self, user: User) -> User:
-        orm = self._session.scalars(select(UserORM).where(UserORM.id == user.id)).first()
+    __slots__ = ("_session",)
 
-        if not orm:
-            raise ValueError(f"User with ID {user.id} not found")
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
 
-        orm.username = user.username
-        orm.email = user.email
-        orm.first_name = user.first_name
-        orm.last_name = user.last_name
-        orm.phone_number = user.phone_number
-        orm.profile_photo_url = user.profile_photo_url
-        # registration_date is immutable
+    async def get_by_id(self, user_id: UUID) -> User | None:
+        return await self._get_one_by(UserORM.id, user_id)
 
-        self._session.flush()
-        return self._to_entity(orm)
+    async def get_by_username(self, username: str) -> User | None:
+        return await self._get_one_by(UserORM.username, username)
 
-    def list_all(self, limit: int = 100, offset: int = 0) -> list[User]:
-        stmt = select(UserORM).order_by(UserORM.username).limit(limit).offset(offset)
-        return [self._to_entity(orm) for orm in self._session.scalars(stmt)]
+    async def get_by_email(self, email: str) -> User | None:
+        return await self._get_one_by(UserORM.email, email)
 
-    def count(self) -> int:
-        return self._session.scalar(select(func.count()).select_from(UserORM)) or 0
+    async def get_by_username_or_email(self, username: str, email: str) -> User | None:
+        stmt = lambda_stmt(
+            lambda: select(*_USER_COLUMNS).where(or_(UserORM.username == username, UserORM.email == email)).limit(2)
+        )
+        rows = (await self._session.execute(stmt)).all()
+        # Both keys are unique, so at most two users can match; report the username clash first
+        row = next((row for row in rows if row.username == username), rows[0] if rows else None)
+        return User.from_trusted(*row) if row is not None else None
+
+    async def save(self, user: User) -> User:
+        orm = self._to_orm(user)
+        self._session.add(orm)
+        await self._session.flush()
+        return self._to_entity(orm)
+
+    async def update(self, user: User) -> User:
+        stmt = (
+            update(UserORM)
+            .where(UserORM.id == user.id)
+            .values(
+                username=user.username,
+                email=user.email,
+                first_name=user.first_name,
+                last_name=user.last_name,
+                phone_number=user.phone_number,
+                profile_photo_url=user.profile_photo_url,
+                # registration_date is immutable
+            )
+            .returning(*_USER_COLUMNS)
+        )
+        row = (await self._session.execute(stmt)).first()
+
+        if row is None:
+            raise UserNotFoundError(f"User with ID {user.id} not found")
+
+        return User.from_trusted(*row)
+
+    async def list_all(
+        self, limit: int = 100, offset: int = 0, after_username: str | None = None
+    ) -> tuple[list[User], int]:
+        # Page and total share one statement: an AsyncSession cannot run a separate
+        # count concurrently (asyncio.gather on one session is unsafe). The total is
+        # an uncorrelated subquery rather than COUNT(*) OVER (), which would have to
+        # read every row past the cursor before LIMIT applies.
+        stmt = _paginate(_LIST_USERS, limit, offset, after_username)
+        rows = (await self._session.execute(stmt)).all()
+        if not rows:
+            # No row carries the total when the page is past the end
+            return [], (await self.count() if offset or after_username is not None else 0)
+        return [User.from_trusted(*row[:-1]) for row in rows], rows[0].total
+
+    async def list_page(self, limit: int = 100, offset: int = 0, after_username: str | None = None) -> list[User]:
+        stmt = _paginate(_LIST_PAGE, limit, offset, after_username)
+        return [User.from_trusted(*row) for row in (await self._session.execute(stmt)).all()]
+
+    async def count(self) -> int:
+        result = await self._session.execute(_COUNT_USERS)
+        return result.scalar() or 0
 
     # --- Private helpers ---
 
-    def _get_one_by[T](self, column: InstrumentedAttribute[T], value: T) -> User | None:
-        """Fetch single user by column match."""
-        orm = self._session.scalars(select(UserORM).where(column == value)).first()
-        return self._to_entity(orm) if orm else None
+    async def _get_one_by[T](self, column: InstrumentedAttribute[T], value: T) -> User | None:
+        """Fetch single user by column match.
+
+        ``lambda_stmt`` caches the statement per column; ``value`` becomes a bound parameter.
+        """
+        stmt = lambda_stmt(lambda: select(*_USER_COLUMNS).where(column == value))
+        row = (await self._session.execute(stmt)).first()
+        return User.from_trusted(*row) if row is not None else None
 
     def _to_entity(self, orm: UserORM) -> User:
-        """Map ORM to domain entity (anti-corruption layer)."""
-        return User(
+        """Map ORM to domain entity (anti-corruption layer).
+
+        Rows were validated on the way in, so invariants are not re-checked here.
+        """
+        return User.from_trusted(
             id=orm.id,
             username=orm.username,
             email=orm.email,
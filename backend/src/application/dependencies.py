@@ -3,10 +3,10 @@
 Connects infrastructure adapters to domain services via dependency inversion.
 """
 
-from typing import Annotated
+from typing import Annotated, Final
 
 from fastapi import Depends
-from sqlalchemy.orm import Session  # type: ignore
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..adapters.outbound.persistence.database import get_db
 from ..adapters.outbound.persistence.sqlalchemy_user_repository import (
@@ -16,15 +16,22 @@ from ..adapters.outbound.time_provider import SystemTimeProvider
 from ..domain.images.services import ImageService
 from ..domain.social.services import SocialService
 from ..domain.time_provider import ITimeProvider
-from ..domain.users.services import UserService
+from ..domain.users.services import UserCountCache, UserService
 
 # Type alias for database session injection
-DbSession = Annotated[Session, Depends(get_db)]
+DbSession = Annotated[AsyncSession, Depends(get_db)]
+
+
+# Stateless, so one instance is shared across requests
+_TIME_PROVIDER: Final[ITimeProvider] = SystemTimeProvider()
+
+# Process-wide, so list pages in every request share the cached total
+user_count_cache: Final = UserCountCache(_TIME_PROVIDER)
 
 
 def get_time_provider() -> ITimeProvider:
     """Production time provider."""
-    return SystemTimeProvider()
+    return _TIME_PROVIDER
 
 
 # Type alias for time provider injection (defined after get_time_provider)
@@ -33,7 +40,7 @@ TimeProviderDep = Annotated[ITimeProvider, Depends(get_time_provider)]
 
 def get_user_service(db: DbSession, time_provider: TimeProviderDep) -> UserService:
     """Wire UserService with SQLAlchemy repository."""
-    return UserService(SQLAlchemyUserRepository(db), time_provider)
+    return UserService(SQLAlchemyUserRepository(db), time_provider, user_count_cache)
 
 
 def get_image_service() -> ImageService:
@@ -19,7 +19,6 @@ class UserProfileResponse(BaseModel):
     registration_date: datetime
 
     model_config = ConfigDict(
-        from_attributes=True,  # Allow creating from ORM models
         json_schema_extra={
             "example": {
                 "id": "123e4567-e89b-12d3-a456-426614174000",
@@ -94,6 +93,7 @@ class UserListResponse(BaseModel):
     total: int
     limit: int
     offset: int
+    next_cursor: str | None = None  # Username to pass as `after` for the next page
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -102,6 +102,7 @@ class UserListResponse(BaseModel):
                 "total": 100,
                 "limit": 20,
                 "offset": 0,
+                "next_cursor": "johndoe",
             }
         }
     )
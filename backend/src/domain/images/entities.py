@@ -3,7 +3,7 @@ from datetime import datetime
 from uuid import UUID
 
 
-@dataclass
+@dataclass(slots=True)
 class Image:
     id: UUID
     owner_id: UUID
@@ -11,7 +11,7 @@ class Image:
     created_at: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class ImageMetadata:
     image_id: UUID
     width: int
@@ -3,7 +3,7 @@ from datetime import datetime
 from uuid import UUID
 
 
-@dataclass
+@dataclass(slots=True)
 class Reaction:
     id: UUID
     user_id: UUID
@@ -11,7 +11,7 @@ class Reaction:
     type: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Comment:
     id: UUID
     user_id: UUID
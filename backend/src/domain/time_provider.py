@@ -24,3 +24,11 @@ class ITimeProvider(Protocol):
             Current time in UTC with timezone information
         """
         ...
+
+    def now_unix_ns(self) -> int:
+        """Get current Unix time in nanoseconds for high-frequency internal timing.
+
+        Returns:
+            Nanoseconds since the Unix epoch
+        """
+        ...
@@ -1,17 +1,52 @@
 """User domain entities with rich business logic and validation."""
 
-import re
+import os
+import string
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Self
-from uuid import UUID, uuid4
+from datetime import UTC, datetime, timedelta
+from typing import Final, Self
+from uuid import UUID
 
 from ..time_provider import ITimeProvider
 
+# Email validation (simplified local@host.tld): deletion tables for each part, so a
+# part is valid exactly when translating it leaves nothing behind
+_EMAIL_LOCAL_TRANS: Final = str.maketrans("", "", string.ascii_letters + string.digits + "._%+-")
+_EMAIL_HOST_TRANS: Final = str.maketrans("", "", string.ascii_letters + string.digits + ".-")
+_EMAIL_TLD_TRANS: Final = str.maketrans("", "", string.ascii_letters)
+# Username validation (letters, digits, underscores): translating with this table
+# deletes every allowed character, so any leftover means the username is invalid
+_USERNAME_TRANS: Final = str.maketrans("", "", string.ascii_letters + string.digits + "_")
 
-@dataclass
+_UNIX_EPOCH: Final = datetime(1970, 1, 1, tzinfo=UTC)
+_ONE_MS: Final = timedelta(milliseconds=1)
+
+
+def _uuid7(at: datetime) -> UUID:
+    """Time-ordered UUIDv7 (RFC 9562) for ``at``: 48-bit Unix ms, version, variant, random bits.
+
+    New ids sort by creation time, so primary-key inserts land on the right edge of the
+    index instead of random pages. Replace with ``uuid.uuid7`` once Python 3.14 is the minimum.
+    """
+    unix_ms = (at - _UNIX_EPOCH) // _ONE_MS
+    value = (unix_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10))
+    value = value & ~(0xF << 76) | 0x7 << 76  # version 7
+    value = value & ~(0x3 << 62) | 0x2 << 62  # RFC 9562 variant
+    return UUID(int=value)
+
+
+class InvalidUserDataError(ValueError):
+    """User field violates a domain invariant."""
+
+
+@dataclass(frozen=True, slots=True)
 class User:
-    """User aggregate root with identity, profile data, and validation rules."""
+    """User aggregate root with identity, profile data, and validation rules.
+
+    Slotted: list endpoints hydrate many instances, and slots drop the per-instance
+    ``__dict__`` and make field reads direct offset loads. Frozen: updates return a
+    new instance, so a ``User`` can be shared or cached without defensive copies.
+    """
 
     id: UUID
     username: str
@@ -22,11 +57,6 @@ class User:
     phone_number: str | None = None
     profile_photo_url: str | None = None
 
-    # Email validation regex (simplified)
-    _EMAIL_REGEX = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
-    # Phone number validation (international format, simplified)
-    _PHONE_REGEX = re.compile(r"^\+?[1-9]\d{1,14}$")
-
     def __post_init__(self) -> None:
         """Enforce invariants on construction."""
         self._validate_username()
@@ -45,70 +75,121 @@ class User:
         phone_number: str | None = None,
         profile_photo_url: str | None = None,
     ) -> Self:
-        """Factory: creates user with generated UUID and current timestamp."""
+        """Factory: creates user with a time-ordered UUID and the current timestamp."""
+        now = time_provider.now()
         return cls(
-            id=uuid4(),
+            id=_uuid7(now),
             username=username,
             email=email,
             first_name=first_name,
             last_name=last_name,
             phone_number=phone_number,
             profile_photo_url=profile_photo_url,
-            registration_date=time_provider.now(),
+            registration_date=now,
         )
 
+    @classmethod
+    def from_trusted(
+        cls,
+        id: UUID,  # noqa: A002
+        username: str,
+        email: str,
+        first_name: str,
+        last_name: str,
+        registration_date: datetime,
+        phone_number: str | None = None,
+        profile_photo_url: str | None = None,
+    ) -> Self:
+        """Rehydrate from already-validated storage without re-running invariants."""
+        user = cls.__new__(cls)
+        set_field = object.__setattr__  # frozen: bypass the raising __setattr__
+        set_field(user, "id", id)
+        set_field(user, "username", username)
+        set_field(user, "email", email)
+        set_field(user, "first_name", first_name)
+        set_field(user, "last_name", last_name)
+        set_field(user, "registration_date", registration_date)
+        set_field(user, "phone_number", phone_number)
+        set_field(user, "profile_photo_url", profile_photo_url)
+        return user
+
     def update_profile(
         self,
         first_name: str | None = None,
         last_name: str | None = None,
         email: str | None = None,
         phone_number: str | None = None,
-    ) -> None:
-        """Partial update - only non-None fields are changed."""
-        if first_name is not None:
-            self.first_name = first_name
-
-        if last_name is not None:
-            self.last_name = last_name
-
+    ) -> Self:
+        """Partial update - returns a copy with only the non-None fields changed."""
+        user = self.from_trusted(
+            id=self.id,
+            username=self.username,
+            email=self.email if email is None else email,
+            first_name=self.first_name if first_name is None else first_name,
+            last_name=self.last_name if last_name is None else last_name,
+            registration_date=self.registration_date,
+            phone_number=self.phone_number if phone_number is None else phone_number,
+            profile_photo_url=self.profile_photo_url,
+        )
+        # Only the changed fields are re-validated, as before
         if email is not None:
-            self.email = email
-            self._validate_email()
-
+            user._validate_email()
         if phone_number is not None:
-            self.phone_number = phone_number
-            self._validate_phone_number()
-
-    def update_profile_photo(self, photo_url: str | None) -> None:
-        """Update profile photo URL."""
-        self.profile_photo_url = photo_url
+            user._validate_phone_number()
+        return user
+
+    def update_profile_photo(self, photo_url: str | None) -> Self:
+        """Return a copy with the profile photo URL replaced."""
+        return self.from_trusted(
+            id=self.id,
+            username=self.username,
+            email=self.email,
+            first_name=self.first_name,
+            last_name=self.last_name,
+            registration_date=self.registration_date,
+            phone_number=self.phone_number,
+            profile_photo_url=photo_url,
+        )
 
     @property
     def full_name(self) -> str:
         """Get user's full name."""
-        return f"{self.first_name} {self.last_name}"
+        return self.first_name + " " + self.last_name
 
     def _validate_username(self) -> None:
         """Validate username follows business rules."""
         if not self.username:
-            raise ValueError("Username cannot be empty")
+            raise InvalidUserDataError("Username cannot be empty")
         if len(self.username) < 3:
-            raise ValueError("Username must be at least 3 characters long")
+            raise InvalidUserDataError("Username must be at least 3 characters long")
         if len(self.username) > 50:
-            raise ValueError("Username must not exceed 50 characters")
-        if not re.match(r"^[a-zA-Z0-9_]+$", self.username):
-            raise ValueError("Username can only contain letters, numbers, and underscores")
+            raise InvalidUserDataError("Username must not exceed 50 characters")
+        if self.username.translate(_USERNAME_TRANS):
+            raise InvalidUserDataError("Username can only contain letters, numbers, and underscores")
 
     def _validate_email(self) -> None:
         """Validate email format."""
         if not self.email:
-            raise ValueError("Email cannot be empty")
-        if not self._EMAIL_REGEX.match(self.email):
-            raise ValueError("Invalid email format")
+            raise InvalidUserDataError("Email cannot be empty")
+        local, _, domain = self.email.partition("@")
+        host, _, tld = domain.rpartition(".")
+        if (
+            not local
+            or not host
+            or len(tld) < 2
+            or local.translate(_EMAIL_LOCAL_TRANS)
+            or host.translate(_EMAIL_HOST_TRANS)
+            or tld.translate(_EMAIL_TLD_TRANS)
+        ):
+            raise InvalidUserDataError("Invalid email format")
         if len(self.email) > 100:
-            raise ValueError("Email must not exceed 100 characters")
+            raise InvalidUserDataError("Email must not exceed 100 characters")
 
     def _validate_phone_number(self) -> None:
         """Validate phone number format if provided."""
-        if self.phone_number and not self._PHONE_REGEX.match(self.phone_number):
-            raise ValueError("Invalid phone number format. Use international format (e.g., +15551234567)")
+        if not self.phone_number:
+            return
+        # International format, simplified: optional "+", then 2-15 ASCII digits not starting with 0
+        digits = self.phone_number.removeprefix("+")
+        if not (2 <= len(digits) <= 15 and digits.isascii() and digits.isdigit() and digits[0] != "0"):
+            raise InvalidUserDataError("Invalid phone number format. Use international format (e.g., +15551234567)")
@@ -1,45 +1,54 @@
 """User repository port (hexagonal architecture)."""
 
-from abc import ABC, abstractmethod
+from typing import Protocol
 from uuid import UUID
 
 from .entities import User
 
 
-class IUserRepository(ABC):
-    """Port defining persistence contract for User aggregate."""
+class IUserRepository(Protocol):
+    """Port defining persistence contract for User aggregate.
 
-    @abstractmethod
-    def get_by_id(self, user_id: UUID) -> User | None:
+    Structural, like ``ITimeProvider``: adapters satisfy it by shape and need not inherit from it.
+    """
+
+    async def get_by_id(self, user_id: UUID) -> User | None:
         """Lookup by UUID."""
         ...
 
-    @abstractmethod
-    def get_by_username(self, username: str) -> User | None:
+    async def get_by_username(self, username: str) -> User | None:
         """Lookup by username."""
         ...
 
-    @abstractmethod
-    def get_by_email(self, email: str) -> User | None:
+    async def get_by_email(self, email: str) -> User | None:
         """Lookup by email."""
         ...
 
-    @abstractmethod
-    def save(self, user: User) -> User:
+    async def get_by_username_or_email(self, username: str, email: str) -> User | None:
+        """Lookup by username or email in one query, preferring the username match."""
+        ...
+
+    async def save(self, user: User) -> User:
         """Insert new user."""
         ...
 
-    @abstractmethod
-    def update(self, user: User) -> User:
-        """Update existing user. Raises ValueError if not found."""
+    async def update(self, user: User) -> User:
+        """Update existing user. Raises UserNotFoundError if not found."""
+        ...
+
+    async def list_all(
+        self, limit: int = 100, offset: int = 0, after_username: str | None = None
+    ) -> tuple[list[User], int]:
+        """Paginated list ordered by username, along with the total user count.
+
+        ``after_username`` is a keyset cursor: only users sorting after it are returned.
+        """
         ...
 
-    @abstractmethod
-    def list_all(self, limit: int = 100, offset: int = 0) -> list[User]:
-        """Paginated list."""
+    async def list_page(self, limit: int = 100, offset: int = 0, after_username: str | None = None) -> list[User]:
+        """Same page as ``list_all``, without counting the users."""
         ...
 
-    @abstractmethod
-    def count(self) -> int:
+    async def count(self) -> int:
         """Total user count."""
         ...
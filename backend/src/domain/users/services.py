@@ -1,42 +1,93 @@
 """User domain service containing business logic and use cases."""
 
+from typing import Final
 from uuid import UUID
 
 from ..time_provider import ITimeProvider
 from .entities import User
 from .repositories import IUserRepository
 
+# How long list pages reuse a counted total before COUNT(*) runs again
+_COUNT_TTL_NS: Final = 5 * 1_000_000_000
+
 
 class UserNotFoundError(Exception):
     """User lookup failed."""
 
 
 class UserAlreadyExistsError(Exception):
-    """Username or email already taken."""
+    """Username or email already taken.
+
+    Carries the conflicting ``field`` and ``value``; the message is only built when rendered.
+    """
+
+    def __init__(self, field: str, value: str, reason: str = "already exists") -> None:
+        super().__init__(field, value, reason)
+        self.field = field
+        self.value = value
+        self.reason = reason
+
+    def __str__(self) -> str:
+        return f"{self.field.capitalize()} '{self.value}' {self.reason}"
+
+
+class UserCountCache:
+    """Total user count shared by list pages for a short TTL.
+
+    ``COUNT(*)`` scans the whole users table, so list pages reuse a recent total instead.
+    The trade-off is a total that can lag by up to ``ttl_ns`` behind writes made by other
+    workers; users created through this process drop the cached value.
+    """
+
+    __slots__ = ("_expires_at_ns", "_time", "_total", "_ttl_ns")
+
+    def __init__(self, time_provider: ITimeProvider, ttl_ns: int = _COUNT_TTL_NS) -> None:
+        self._time = time_provider
+        self._ttl_ns = ttl_ns
+        self._total: int | None = None
+        self._expires_at_ns = 0
+
+    def get(self) -> int | None:
+        """Cached total, or None if missing or expired."""
+        if self._total is not None and self._time.now_unix_ns() < self._expires_at_ns:
+            return self._total
+        return None
+
+    def set(self, total: int) -> None:
+        """Store a freshly counted total."""
+        self._total = total
+        self._expires_at_ns = self._time.now_unix_ns() + self._ttl_ns
+
+    def invalidate(self) -> None:
+        """Drop the cached total so the next list page counts again."""
+        self._total = None
 
 
 class UserService:
     """Orchestrates user-related use cases and enforces business rules."""
 
-    def __init__(self, user_repo: IUserRepository, time_provider: ITimeProvider) -> None:
+    __slots__ = ("_repo", "_time", "_user_count")
+
+    def __init__(self, user_repo: IUserRepository, time_provider: ITimeProvider, user_count: UserCountCache) -> None:
         self._repo = user_repo
         self._time = time_provider
+        self._user_count = user_count
 
-    def get_user(self, user_id: UUID) -> User:
+    async def get_user(self, user_id: UUID) -> User:
         """Fetch user by ID or raise UserNotFoundError."""
-        user = self._repo.get_by_id(user_id)
-        if not user:
+        user = await self._repo.get_by_id(user_id)
+        if user is None:
             raise UserNotFoundError(f"User with ID {user_id} not found")
         return user
 
-    def get_user_by_username(self, username: str) -> User:
+    async def get_user_by_username(self, username: str) -> User:
         """Fetch user by username or raise UserNotFoundError."""
-        user = self._repo.get_by_username(username)
-        if not user:
+        user = await self._repo.get_by_username(username)
+        if user is None:
             raise UserNotFoundError(f"User with username '{username}' not found")
         return user
 
-    def create_user(
+    async def create_user(
         self,
         username: str,
         email: str,
@@ -46,10 +97,11 @@ class UserService:
         profile_photo_url: str | None = None,
     ) -> User:
         """Create user after validating uniqueness constraints."""
-        if self._repo.get_by_username(username):
-            raise UserAlreadyExistsError(f"Username '{username}' already exists")
-        if self._repo.get_by_email(email):
-            raise UserAlreadyExistsError(f"Email '{email}' already exists")
+        existing = await self._repo.get_by_username_or_email(username, email)
+        if existing is not None:
+            if existing.username == username:
+                raise UserAlreadyExistsError("username", username)
+            raise UserAlreadyExistsError("email", email)
 
         user = User.create_new(
             username=username,
@@ -60,9 +112,11 @@ class UserService:
             phone_number=phone_number,
             profile_photo_url=profile_photo_url,
         )
-        return self._repo.save(user)
+        saved = await self._repo.save(user)
+        self._user_count.invalidate()
+        return saved
 
-    def update_user_profile(
+    async def update_user_profile(
         self,
         user_id: UUID,
         first_name: str | None = None,
@@ -71,29 +125,38 @@ class UserService:
         phone_number: str | None = None,
     ) -> User:
         """Partial update of profile fields with email uniqueness check."""
-        user = self.get_user(user_id)
+        user = await self.get_user(user_id)
 
         if email and email != user.email:
-            existing = self._repo.get_by_email(email)
-            if existing and existing.id != user_id:
-                raise UserAlreadyExistsError(f"Email '{email}' already in use")
+            existing = await self._repo.get_by_email(email)
+            if existing is not None and existing.id != user_id:
+                raise UserAlreadyExistsError("email", email, "already in use")
 
-        user.update_profile(
+        user = user.update_profile(
             first_name=first_name,
             last_name=last_name,
             email=email,
             phone_number=phone_number,
         )
-        return self._repo.update(user)
-
-    def list_users(self, limit: int = 100, offset: int = 0) -> list[User]:
-        """Paginated user list. Limit: 1-1000."""
+        return await self._repo.update(user)
+
+    async def list_users(
+        self, limit: int = 100, offset: int = 0, after_username: str | None = None
+    ) -> tuple[list[User], int]:
+        """Paginated user list with total count. Limit: 1-1000.
+
+        Pass the last username of the previous page as ``after_username`` for
+        keyset pagination, which stays fast on deep pages unlike ``offset``.
+        The total comes from ``UserCountCache`` while it is fresh, so most pages
+        skip the count; otherwise page and total are fetched in one query.
+        """
         if not 1 <= limit <= 1000:
             raise ValueError("Limit must be between 1 and 1000")
         if offset < 0:
             raise ValueError("Offset must be non-negative")
-        return self._repo.list_all(limit=limit, offset=offset)
-
-    def get_total_user_count(self) -> int:
-        """Total user count for pagination metadata."""
-        return self._repo.count()
+        total = self._user_count.get()
+        if total is not None:
+            return await self._repo.list_page(limit=limit, offset=offset, after_username=after_username), total
+        users, total = await self._repo.list_all(limit=limit, offset=offset, after_username=after_username)
+        self._user_count.set(total)
+        return users, total
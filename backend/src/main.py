@@ -1,24 +1,60 @@
-from fastapi import FastAPI
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+
+import orjson
+from fastapi import FastAPI, Request, status
+from fastapi.responses import ORJSONResponse, Response
 
 from .adapters.inbound.api.images import router as images_router
 from .adapters.inbound.api.social import router as social_router
 from .adapters.inbound.api.users import router as users_router
-from .adapters.outbound.persistence.database import create_tables
+from .adapters.outbound.persistence.database import create_tables, engine
+from .domain.users.entities import InvalidUserDataError
+from .domain.users.services import UserAlreadyExistsError, UserNotFoundError
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncGenerator[None]:
+    # Create database tables on startup, release pooled connections on shutdown
+    await create_tables()
+    yield
+    await engine.dispose()
+
 
 app = FastAPI(
     title="uGram API",
     description=("Instagram-like application backend with user profiles, images, and social features"),
     version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
-# Create database tables on startup
-create_tables()
+
+# Map domain exceptions to HTTP responses once, at the ASGI layer
+@app.exception_handler(UserNotFoundError)
+async def user_not_found_handler(_request: Request, exc: UserNotFoundError) -> ORJSONResponse:
+    return ORJSONResponse(status_code=status.HTTP_404_NOT_FOUND, content={"detail": str(exc)})
+
+
+@app.exception_handler(UserAlreadyExistsError)
+async def user_already_exists_handler(_request: Request, exc: UserAlreadyExistsError) -> ORJSONResponse:
+    return ORJSONResponse(status_code=status.HTTP_409_CONFLICT, content={"detail": str(exc)})
+
+
+@app.exception_handler(InvalidUserDataError)
+async def invalid_user_data_handler(_request: Request, exc: InvalidUserDataError) -> ORJSONResponse:
+    return ORJSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content={"detail": str(exc)})
+
 
 app.include_router(users_router)
 app.include_router(images_router)
 app.include_router(social_router)
 
 
+# Static payload, serialized once at import instead of on every probe
+_HEALTH_BODY = orjson.dumps({"status": "ok"})
+
+
 @app.get("/")
-def health_check() -> dict[str, str]:
-    return {"status": "ok"}
+async def health_check() -> Response:
+    return Response(_HEALTH_BODY, media_type="application/json")
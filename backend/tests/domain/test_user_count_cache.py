@@ -0,0 +1,39 @@
+from datetime import UTC, datetime
+
+from src.domain.users.services import UserCountCache
+
+
+class ManualClock:
+    """Time provider whose clock only moves when told to."""
+
+    def __init__(self) -> None:
+        self.ns = 0
+
+    def now(self) -> datetime:
+        return datetime.fromtimestamp(self.ns / 1_000_000_000, UTC)
+
+    def now_unix_ns(self) -> int:
+        return self.ns
+
+
+def test_serves_total_until_ttl_expires() -> None:
+    """A stored total is returned until the TTL elapses."""
+    clock = ManualClock()
+    cache = UserCountCache(clock, ttl_ns=100)
+
+    assert cache.get() is None
+    cache.set(7)
+    clock.ns = 99
+    assert cache.get() == 7
+    clock.ns = 100
+    assert cache.get() is None
+
+
+def test_invalidate_drops_total() -> None:
+    """Invalidation forces the next caller to count again."""
+    cache = UserCountCache(ManualClock(), ttl_ns=100)
+    cache.set(7)
+
+    cache.invalidate()
+
+    assert cache.get() is None
@@ -0,0 +1,171 @@
+from dataclasses import FrozenInstanceError
+from datetime import UTC, datetime, timedelta
+from typing import TypedDict, Unpack
+from uuid import RFC_4122, UUID, uuid4
+
+import pytest
+from src.domain.users.entities import InvalidUserDataError, User
+
+REGISTERED_AT = datetime(2026, 1, 14, 10, 30, tzinfo=UTC)
+
+
+class FixedTimeProvider:
+    """Time provider pinned to a single instant."""
+
+    def __init__(self, at: datetime) -> None:
+        self._at = at
+
+    def now(self) -> datetime:
+        return self._at
+
+    def now_unix_ns(self) -> int:
+        return int(self._at.timestamp()) * 1_000_000_000
+
+
+class UserFields(TypedDict, total=False):
+    """User fields a test can override."""
+
+    id: UUID
+    username: str
+    email: str
+    first_name: str
+    last_name: str
+    phone_number: str | None
+
+
+def _fields(**overrides: Unpack[UserFields]) -> UserFields:
+    """Valid user fields, with ``overrides`` applied."""
+    return {
+        "id": uuid4(),
+        "username": "test_user",
+        "email": "user@example.com",
+        "first_name": "Test",
+        "last_name": "User",
+        **overrides,
+    }
+
+
+def _user(**overrides: Unpack[UserFields]) -> User:
+    """Build a user through the validating constructor."""
+    return User(registration_date=REGISTERED_AT, **_fields(**overrides))
+
+
+def _trusted_user(**overrides: Unpack[UserFields]) -> User:
+    """Build a user through trusted rehydration, skipping validation."""
+    return User.from_trusted(registration_date=REGISTERED_AT, **_fields(**overrides))
+
+
+def test_constructor_enforces_invariants() -> None:
+    """Direct construction validates fields."""
+    with pytest.raises(InvalidUserDataError, match="Username"):
+        _user(username="no spaces allowed")
+
+
+@pytest.mark.parametrize("username", ["abc", "John_Doe_42", "___"])
+def test_accepts_valid_usernames(username: str) -> None:
+    """Letters, digits and underscores are allowed."""
+    assert _user(username=username).username == username
+
+
+@pytest.mark.parametrize("username", ["bad-name", "héllo", "name!", "ab cd", "user\u0663\u0664"])
+def test_rejects_invalid_usernames(username: str) -> None:
+    """Anything outside ASCII letters, digits and underscores is rejected."""
+    with pytest.raises(ValueError, match="Username can only contain"):
+        _user(username=username)
+
+
+def test_from_trusted_rehydrates_without_validation() -> None:
+    """Trusted rehydration keeps every field and skips invariant checks."""
+    user_id = uuid4()
+
+    user = _trusted_user(id=user_id, username="legacy name", phone_number="+15551234567")
+
+    assert user.id == user_id
+    assert user.username == "legacy name"
+    assert user.phone_number == "+15551234567"
+    assert user.profile_photo_url is None
+    assert user.registration_date == REGISTERED_AT
+
+
+@pytest.mark.parametrize("email", ["user@example.com", "first.last+tag@mail.example.co", "a_b%c-d@sub-domain.io"])
+def test_accepts_valid_emails(email: str) -> None:
+    """Common local@host.tld addresses are accepted."""
+    assert _user(email=email).email == email
+
+
+@pytest.mark.parametrize(
+    "email",
+    [
+        "userexample.com",
+        "@example.com",
+        "user@.com",
+        "user@example",
+        "user@example.c",
+        "a@b@example.com",
+        "ü@example.com",
+    ],
+)
+def test_rejects_invalid_emails(email: str) -> None:
+    """Missing parts, short TLDs, extra @ signs and non-ASCII are rejected."""
+    with pytest.raises(ValueError, match="Invalid email format"):
+        _user(email=email)
+
+
+def test_full_name_joins_first_and_last_name() -> None:
+    """Full name is first and last name separated by a space."""
+    assert _trusted_user(first_name="Ada", last_name="Lovelace").full_name == "Ada Lovelace"
+
+
+def test_update_profile_returns_updated_copy() -> None:
+    """Updates leave the original untouched and cannot be applied in place."""
+    user = _trusted_user(first_name="Ada", last_name="Lovelace")
+
+    updated = user.update_profile(last_name="Byron", email="ada@example.com")
+
+    assert updated == _trusted_user(id=user.id, first_name="Ada", last_name="Byron", email="ada@example.com")
+    assert user.email == "user@example.com"
+    with pytest.raises(FrozenInstanceError):
+        user.email = "other@example.com"  # type: ignore[misc]
+
+
+def test_update_profile_validates_changed_email() -> None:
+    """A new email must still be well formed."""
+    with pytest.raises(ValueError, match="Invalid email format"):
+        _trusted_user().update_profile(email="not-an-email")
+
+
+@pytest.mark.parametrize("phone_number", ["+15551234567", "15551234567", "+442071838750"])
+def test_accepts_valid_phone_numbers(phone_number: str) -> None:
+    """International numbers with an optional leading plus are accepted."""
+    assert _user(phone_number=phone_number).phone_number == phone_number
+
+
+@pytest.mark.parametrize(
+    "phone_number",
+    [
+        "+05551234567",
+        "+1",
+        "+1234567890123456",
+        "555-123-4567",
+        "+15551234567\n",
+        "++15551234567",
+        "+\u0661\u0665\u0665\u0665",
+    ],
+)
+def test_rejects_invalid_phone_numbers(phone_number: str) -> None:
+    """Leading zeros, wrong lengths, separators and trailing characters are rejected."""
+    with pytest.raises(ValueError, match="Invalid phone number format"):
+        _user(phone_number=phone_number)
+
+
+def test_create_new_assigns_time_ordered_uuid7() -> None:
+    """New ids are UUIDv7 stamped with the registration time, so they sort by creation."""
+    later = FixedTimeProvider(REGISTERED_AT + timedelta(milliseconds=1))
+    first = User.create_new("first_user", "first@example.com", "A", "B", FixedTimeProvider(REGISTERED_AT))
+    second = User.create_new("second_user", "second@example.com", "A", "B", later)
+
+    assert first.id.version == 7
+    assert first.id.variant == RFC_4122
+    assert first.id.int >> 80 == int(REGISTERED_AT.timestamp() * 1000)
+    assert first.registration_date == REGISTERED_AT
+    assert first.id < second.id
@@ -0,0 +1,77 @@
+"""Pytest configuration and fixtures.
+
+This module provides shared test fixtures including the FastAPI test client
+with proper database isolation for integration tests.
+"""
+
+import asyncio
+from collections.abc import AsyncGenerator, Generator
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+from src.adapters.outbound.persistence.database import get_db
+from src.adapters.outbound.persistence.models import Base
+from src.application.config import get_settings
+from src.application.dependencies import user_count_cache
+from src.main import app
+
+# Use the same PostgreSQL database from settings for testing
+TEST_DATABASE_URL = get_settings().DATABASE_URL
+
+# NullPool: each TestClient runs its own event loop, so connections must not be reused across tests
+test_engine = create_async_engine(TEST_DATABASE_URL, echo=False, poolclass=NullPool)
+TestSessionLocal = async_sessionmaker(bind=test_engine, autoflush=False, expire_on_commit=False)
+
+
+async def override_get_db() -> AsyncGenerator[AsyncSession]:
+    """Override database dependency for testing."""
+    async with TestSessionLocal() as db:
+        try:
+            yield db
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+
+
+async def _create_all() -> None:
+    async with test_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+
+async def _drop_all() -> None:
+    async with test_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+
+
+async def _delete_all_rows() -> None:
+    async with test_engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            await conn.execute(table.delete())
+
+
+@pytest.fixture(scope="session", autouse=True)
+def setup_database() -> Generator[None]:
+    """Create database tables once per test session and drop them at the end."""
+    asyncio.run(_create_all())
+    yield
+    asyncio.run(_drop_all())
+
+
+@pytest.fixture(autouse=True)
+def clean_tables() -> Generator[None]:
+    """Empty all tables after each test, keeping tests isolated without per-test DDL."""
+    yield
+    asyncio.run(_delete_all_rows())
+    user_count_cache.invalidate()  # rows were deleted behind the service's back
+
+
+@pytest.fixture
+def client() -> Generator[TestClient]:
+    """Provide a test client with database dependency overridden."""
+    app.dependency_overrides[get_db] = override_get_db
+    with TestClient(app) as c:
+        yield c
+    app.dependency_overrides.clear()
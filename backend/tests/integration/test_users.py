@@ -53,9 +53,12 @@ class UserAPIClient:
         response = self.client.get(f"/users/{user_id}")
         return response.status_code, response.json()
 
-    def list(self, limit: int = 20, offset: int = 0) -> tuple[int, dict]:
+    def list(self, limit: int = 20, offset: int = 0, after: str | None = None) -> tuple[int, dict]:
         """List users with pagination."""
-        response = self.client.get("/users", params={"limit": limit, "offset": offset})
+        params: dict[str, str | int] = {"limit": limit, "offset": offset}
+        if after is not None:
+            params["after"] = after
+        response = self.client.get("/users", params=params)
         return response.status_code, response.json()
 
     def update(self, user_id: str, updates: dict) -> tuple[int, dict]:
@@ -130,6 +133,48 @@ class TestCreateUser:
         assert data["phone_number"] is None
         assert data["profile_photo_url"] is None
 
+    def test_rejects_duplicate_username(self, api: UserAPIClient, created_user: dict) -> None:
+        """Creating a user with a taken username returns 409."""
+        payload = UserPayload(
+            username=created_user["username"],
+            email="other@example.com",
+            first_name="Other",
+            last_name="User",
+        )
+
+        status, data = api.create(payload)
+
+        assert status == 409
+        assert "already exists" in data["detail"]
+
+    def test_rejects_email_breaking_domain_rules(self, api: UserAPIClient) -> None:
+        """An email the request schema accepts but the domain rejects returns 400."""
+        payload = UserPayload(
+            username="long_email",
+            email="a" * 60 + "@" + "b" * 40 + ".com",
+            first_name="Long",
+            last_name="Email",
+        )
+
+        status, data = api.create(payload)
+
+        assert status == 400
+        assert data["detail"] == "Email must not exceed 100 characters"
+
+    def test_rejects_duplicate_email(self, api: UserAPIClient, created_user: dict) -> None:
+        """Creating a user with a taken email returns 409."""
+        payload = UserPayload(
+            username="other_user",
+            email=created_user["email"],
+            first_name="Other",
+            last_name="User",
+        )
+
+        status, data = api.create(payload)
+
+        assert status == 409
+        assert data["detail"] == f"Email '{created_user['email']}' already exists"
+
 
 class TestGetUser:
     """Tests for retrieving a user."""
@@ -142,6 +187,13 @@ class TestGetUser:
         assert data["id"] == created_user["id"]
         assert data["username"] == created_user["username"]
 
+    def test_returns_404_for_unknown_user(self, api: UserAPIClient) -> None:
+        """Getting a missing user returns 404."""
+        status, data = api.get("00000000-0000-0000-0000-000000000000")
+
+        assert status == 404
+        assert "not found" in data["detail"]
+
 
 class TestListUsers:
     """Tests for listing users."""
@@ -185,6 +237,58 @@ class TestListUsers:
         page2_ids = {u["id"] for u in page2["users"]}
         assert page1_ids.isdisjoint(page2_ids)
 
+    def test_out_of_range_paging_is_clamped(self, api: UserAPIClient) -> None:
+        """Limit and offset outside their bounds are clamped instead of rejected."""
+        status, data = api.list(limit=500, offset=-5)
+
+        assert status == 200
+        assert data["limit"] == 100
+        assert data["offset"] == 0
+
+    def test_cursor_pagination_walks_all_users(self, api: UserAPIClient) -> None:
+        """Following next_cursor returns every user once, in username order."""
+        for name in ["carol", "alice", "bob"]:
+            api.create(UserPayload(username=name, email=f"{name}@example.com", first_name=name, last_name="User"))
+
+        _, page1 = api.list(limit=2)
+        _, page2 = api.list(limit=2, after=page1["next_cursor"])
+
+        assert [u["username"] for u in page1["users"]] == ["alice", "bob"]
+        assert page1["next_cursor"] == "bob"
+        assert [u["username"] for u in page2["users"]] == ["carol"]
+        assert page2["next_cursor"] is None
+        assert page2["total"] == 3
+
+    def test_total_counts_all_users_on_every_page(self, api: UserAPIClient) -> None:
+        """Total reflects all users, including on pages past the end."""
+        for i in range(3):
+            payload = UserPayload(
+                username=f"totaluser{i}",
+                email=f"total{i}@example.com",
+                first_name=f"Total{i}",
+                last_name="User",
+            )
+            api.create(payload)
+
+        _, page = api.list(limit=2, offset=0)
+        _, past_end = api.list(limit=2, offset=10)
+
+        assert page["total"] == 3
+        assert past_end["users"] == []
+        assert past_end["total"] == 3
+
+    def test_total_includes_user_created_after_listing(self, api: UserAPIClient, sample_user: UserPayload) -> None:
+        """Creating a user refreshes the cached total used by list pages."""
+        api.create(sample_user)
+        _, before = api.list()
+        api.create(UserPayload(username="newcomer", email="newcomer@example.com", first_name="New", last_name="User"))
+
+        _, after = api.list()
+
+        assert before["total"] == 1
+        assert after["total"] == 2
+        assert [u["username"] for u in after["users"]] == sorted([sample_user.username, "newcomer"])
+
 
 class TestUpdateUser:
     """Tests for updating user profile."""
@@ -205,6 +309,16 @@ class TestUpdateUser:
         assert data["email"] == "updated@example.com"
         assert data["username"] == created_user["username"]  # Unchanged
 
+    def test_rejects_email_taken_by_another_user(self, api: UserAPIClient, created_user: dict) -> None:
+        """Changing email to one another user has returns 409."""
+        other = UserPayload(username="other_user", email="other@example.com", first_name="Other", last_name="User")
+        api.create(other)
+
+        status, data = api.update(created_user["id"], {"email": other.email})
+
+        assert status == 409
+        assert data["detail"] == f"Email '{other.email}' already in use"
+
 
 class TestUserLifecycle:
     """End-to-end lifecycle test."""